@@ -13,6 +13,8 @@ from bacpypes.primitivedata import CharacterString, Date, Time, Real, Boolean, I
 from bacpypes.basetypes import EngineeringUnits, BinaryPV, Polarity
 from bacpypes.local.object import AnalogValueCmdObject, Commandable, MinOnOff
 
+from ...io._read_fast import clear_datatype_cache
+
 _SHOULD_BE_COMMANDABLE = ["relinquishDefault", "outOfService", "lowLimit", "highLimit"]
 
 """
@@ -108,6 +110,7 @@ def make_commandable():
             new_type = type(base_cls_name, (_commando, base_cls), {})
             new_type.__name__ = base_cls_name
             register_object_type(new_type, vendor_id=842)
+            clear_datatype_cache()
             objectType, instance, objectName, presentValue, description = args
             new_object = new_type(
                 objectIdentifier=(base_cls.objectType, instance),
@@ -134,6 +137,7 @@ def add_feature(cls):
             base_cls_name = obj.__class__.__name__ + cls.__name__
             new_type = type(base_cls_name, (cls, base_cls), {})
             register_object_type(new_type, vendor_id=842)
+            clear_datatype_cache()
             instance, objectName, presentValue, description = args
             new_object = new_type(
                 objectIdentifier=(base_cls.objectType, instance),
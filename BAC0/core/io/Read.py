@@ -17,28 +17,32 @@ Read.py - creation of ReadProperty and ReadPropertyMultiple requests
         ReadProperty()
             def read()
             def readMultiple()
+            def readMany()
+            def read_tuple()
+            def readMultiple_spec()
+            async def read_async()
+            async def readMultiple_async()
 
 """
 
 # --- standard Python modules ---
+import asyncio
+import weakref
+from functools import partial
+from collections import deque
 
 # --- 3rd party modules ---
+import async_timeout
 from bacpypes.debugging import bacpypes_debugging
 
-from bacpypes.pdu import Address
-from bacpypes.object import get_object_class, get_datatype
 from bacpypes.apdu import (
+    ErrorPDU,
     PropertyReference,
-    ReadAccessSpecification,
     ReadPropertyRequest,
     ReadPropertyMultipleRequest,
-    RejectReason,
-    AbortReason,
-    RejectPDU,
-    AbortPDU,
 )
 
-from bacpypes.basetypes import PropertyIdentifier, DateTime
+from bacpypes.basetypes import DateTime
 from bacpypes.apdu import (
     ReadPropertyMultipleACK,
     ReadPropertyACK,
@@ -50,7 +54,6 @@ from bacpypes.apdu import (
     RangeByTime,
 )
 from bacpypes.primitivedata import Tag, ObjectIdentifier, Unsigned, Date, Time
-from bacpypes.constructeddata import Array
 from bacpypes.iocb import IOCB, TimeoutError
 from bacpypes.core import deferred
 
@@ -70,9 +73,43 @@ from .IOExceptions import (
 from bacpypes.object import registered_object_types
 
 from ..utils.notes import note_and_log
+from ._read_fast import (
+    _get_datatype,
+    _get_object_class,
+    _cast_target,
+    _address,
+    _PROP_ENUMS,
+    _UNCHECKED_PROPS,
+    find_reason,
+    validate_object_type,
+    parse_rp_args,
+    build_read_access_spec_list,
+    _compile_rpm,
+    build_read_access_spec,
+)
 
 # ------------------------------------------------------------------------------
 
+# Number of array elements requested per ReadPropertyMultiple when a
+# read must be split because the device doesn't support segmentation
+SPLIT_READ_CHUNK_SIZE = 20
+
+# Reasons a device gives when a ReadPropertyMultiple answer would be too
+# large. Only those make the split read retry with a smaller chunk.
+_SIZE_ABORT_REASONS = frozenset(
+    ("segmentationNotSupported", "bufferOverflow", "apduTooLong")
+)
+
+# Errors after which a ReadProperty is split in many requests
+_SPLIT_READ_REASONS = frozenset(("segmentationNotSupported", "bufferOverflow"))
+
+# Returned by ReadProperty._read_array_indexes when the device answered with
+# an error: the elements must be read one by one
+_READ_ONE_BY_ONE = object()
+
+# Number of devices readMany() has a ReadProperty request pending with at once
+READ_MANY_CHUNK_SIZE = 20
+
 
 @note_and_log
 class ReadProperty:
@@ -107,6 +144,241 @@ class ReadProperty:
         Requests the controller at (Network 2, address 5) for the presentValue of
         its analog input 1 (AI:1).
         """
+        iocb = self._submit_read(
+            args,
+            arr_index=arr_index,
+            vendor_id=vendor_id,
+            bacoid=bacoid,
+            timeout=timeout,
+        )
+        iocb.wait()  # Wait for BACnet response
+        return self._process_read_response(
+            iocb,
+            args,
+            arr_index=arr_index,
+            vendor_id=vendor_id,
+            show_property_name=show_property_name,
+        )
+
+    async def read_async(
+        self,
+        args,
+        arr_index=None,
+        vendor_id=0,
+        bacoid=None,
+        timeout=10,
+        show_property_name=False,
+    ):
+        """
+        Coroutine version of read(). The calling thread is not blocked while
+        the request is pending so multiple reads can be awaited together.
+
+        bacpypes sends one request at a time to a given device: reads to
+        different devices run concurrently, reads to the same device are
+        sent one after the other. The timeout of each read only starts when
+        its request is sent.
+
+        When the answer is too large for the device (no segmentation), the
+        read is split in many blocking requests, as read() does. Those run
+        in the default executor of the loop.
+
+        *Example*::
+
+            values = await asyncio.gather(
+                bacnet.read_async('2:5 analogInput 1 presentValue'),
+                bacnet.read_async('2:6 analogInput 1 presentValue'),
+            )
+        """
+        process = partial(
+            self._process_read_response,
+            args=args,
+            arr_index=arr_index,
+            vendor_id=vendor_id,
+            show_property_name=show_property_name,
+        )
+        async with self._destination_lock(args.split()[0]):
+            iocb = self._submit_read(
+                args,
+                arr_index=arr_index,
+                vendor_id=vendor_id,
+                bacoid=bacoid,
+                timeout=None,
+            )
+            await self._await_iocb(iocb, timeout=timeout)
+            if iocb.ioError and find_reason(iocb.ioError) in _SPLIT_READ_REASONS:
+                # the device is still locked while its array is read in parts
+                return await asyncio.get_running_loop().run_in_executor(
+                    None, partial(process, iocb)
+                )
+        return process(iocb)
+
+    def readMany(
+        self,
+        args_list,
+        vendor_id=0,
+        timeout=10,
+        show_property_name=False,
+        chunk_size=READ_MANY_CHUNK_SIZE,
+    ):
+        """
+        Build a ReadProperty request for each string of args_list, pass one
+        request per device to the BACnet stack, then wait for the answers.
+
+        :param args_list: list of strings with <addr> <type> <inst> <prop> [ <indx> ]
+        :returns: list of values, in the order of args_list. None for a
+            request that failed (the reason is logged).
+
+        *Example*::
+
+            bacnet.readMany(['2:5 analogInput 1 presentValue',
+                             '2:6 analogInput 1 presentValue'])
+
+        bacpypes sends one request at a time to a given device and a request
+        waiting in the stack counts towards its timeout. So a device only has
+        one pending request at a time: requests to different devices (up to
+        chunk_size of them) are sent concurrently, requests to the same device
+        are sent one after the other, like with read().
+        """
+        # positions in args_list of the requests for each device, in order
+        pending = {}
+        for position, args in enumerate(args_list):
+            pending.setdefault(args.split()[0], deque()).append(position)
+
+        values = [None] * len(args_list)
+        while pending:
+            batch = []
+            for addr in list(pending)[:chunk_size]:
+                positions = pending[addr]
+                batch.append(positions.popleft())
+                if not positions:
+                    del pending[addr]
+
+            iocbs = [
+                self._submit_read(
+                    args_list[position], vendor_id=vendor_id, timeout=timeout
+                )
+                for position in batch
+            ]
+            for position, iocb in zip(batch, iocbs):
+                iocb.wait()  # Wait for BACnet response
+                try:
+                    values[position] = self._process_read_response(
+                        iocb,
+                        args_list[position],
+                        vendor_id=vendor_id,
+                        show_property_name=show_property_name,
+                    )
+                except (
+                    NoResponseFromController,
+                    UnknownPropertyError,
+                    UnknownObjectError,
+                    UnrecognizedService,
+                    SegmentationNotSupported,
+                ) as error:
+                    self._log.warning(
+                        "Read of {} failed : {!r}".format(args_list[position], error)
+                    )
+        return values
+
+    def read_tuple(
+        self,
+        addr,
+        obj_type,
+        obj_inst,
+        prop_id,
+        arr_index=None,
+        vendor_id=0,
+        timeout=10,
+        show_property_name=False,
+    ):
+        """
+        Same as read() but using already parsed arguments instead of a string.
+        obj_type and prop_id can be names or numeric identifiers (int).
+
+        *Example*::
+
+            bacnet.read_tuple('2:5', 'analogInput', 1, 'presentValue')
+        """
+        if not self._started:
+            raise ApplicationNotStarted("BACnet stack not running - use startApp()")
+
+        args = (addr, obj_type, obj_inst, prop_id)
+        iocb = self._submit_request(
+            self.build_rp_request_from_tuple(
+                *args, arr_index=arr_index, vendor_id=vendor_id
+            ),
+            timeout=timeout,
+        )
+        iocb.wait()  # Wait for BACnet response
+        return self._process_read_response(
+            iocb,
+            args,
+            arr_index=arr_index,
+            vendor_id=vendor_id,
+            show_property_name=show_property_name,
+        )
+
+    def _destination_lock(self, addr):
+        """
+        Lock held by a coroutine while its request to addr is pending.
+        bacpypes queues requests per device and would send them one at a
+        time anyway, but a request waiting in that queue would use up its
+        timeout. Locks are kept per event loop.
+        """
+        try:
+            locks_by_loop = self._async_read_locks
+        except AttributeError:
+            locks_by_loop = self._async_read_locks = weakref.WeakKeyDictionary()
+        locks = locks_by_loop.setdefault(asyncio.get_running_loop(), {})
+        try:
+            return locks[addr]
+        except KeyError:
+            lock = locks[addr] = asyncio.Lock()
+            return lock
+
+    async def _await_iocb(self, iocb, timeout=10):
+        """
+        Wait for the IOCB completion without blocking the event loop.
+        The bacpypes core runs in its own thread, so the completion is
+        handed back to the loop with call_soon_threadsafe.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def _set_result(iocb):
+            if not future.done():
+                future.set_result(iocb)
+
+        def _completed(iocb):
+            # called in the bacpypes thread, maybe once the loop is closed
+            # (an abort after a timeout or a cancel)
+            if loop.is_closed():
+                return
+            try:
+                loop.call_soon_threadsafe(_set_result, iocb)
+            except RuntimeError:
+                # closed in the meantime
+                pass
+
+        iocb.add_callback(_completed)
+        try:
+            async with async_timeout.timeout(timeout):
+                return await future
+        except asyncio.CancelledError:
+            # no timer is armed on the IOCB, the stack must be told
+            deferred(iocb.abort, RuntimeError("cancelled"))
+            raise
+        except asyncio.TimeoutError:
+            # let the stack forget about the request
+            deferred(iocb.abort, TimeoutError)
+            raise NoResponseFromController("APDU Abort Reason : Timeout")
+
+    def _submit_read(self, args, arr_index=None, vendor_id=0, bacoid=None, timeout=10):
+        """
+        Build a ReadProperty request and pass it to the BACnet stack.
+        Returns the IOCB that will hold the answer. With timeout=None, no
+        timer is armed on the IOCB and the caller handles the timeout.
+        """
         if not self._started:
             raise ApplicationNotStarted("BACnet stack not running - use startApp()")
 
@@ -114,60 +386,58 @@ class ReadProperty:
 
         self.log_title("Read property", args_split)
 
-        vendor_id = vendor_id
-        bacoid = bacoid
-
         try:
             # build ReadProperty request
-            iocb = IOCB(
+            iocb = self._submit_request(
                 self.build_rp_request(
                     args_split, arr_index=arr_index, vendor_id=vendor_id, bacoid=bacoid
-                )
+                ),
+                timeout=timeout,
             )
-            iocb.set_timeout(timeout)
-            # pass to the BACnet stack
-            deferred(self.this_application.request_io, iocb)
-            self._log.debug("{:<20} {!r}".format("iocb", iocb))
 
         except ReadPropertyException as error:
             # construction error
             self._log.exception("exception: {!r}".format(error))
 
-        iocb.wait()  # Wait for BACnet response
+        return iocb
 
+    def _submit_request(self, request, timeout=10):
+        """
+        Pass a request to the BACnet stack and return its IOCB.
+        With timeout=None, no timer is armed on the IOCB.
+        """
+        iocb = IOCB(request)
+        if timeout is not None:
+            iocb.set_timeout(timeout)
+        # pass to the BACnet stack
+        deferred(self._request_io, iocb)
+        self._log.debug("%-20s %r", "iocb", iocb)
+        return iocb
+
+    def _process_read_response(
+        self, iocb, args, arr_index=None, vendor_id=0, show_property_name=False
+    ):
+        """
+        Decode the answer of a completed ReadProperty IOCB
+        """
         if iocb.ioResponse:  # successful response
             apdu = iocb.ioResponse
 
             if not isinstance(apdu, ReadPropertyACK):  # expecting an ACK
                 self._log.warning("Not an ack, see debug for more infos.")
-                self._log.debug("Not an ack. | APDU : {}".format(apdu))
+                self._log.debug("Not an ack. | APDU : %s", apdu)
                 return
 
-            # find the datatype
-            datatype = get_datatype(
-                apdu.objectIdentifier[0], apdu.propertyIdentifier, vendor_id=vendor_id
+            value, datatype = self._cast_value(
+                apdu.propertyValue,
+                apdu.objectIdentifier[0],
+                apdu.propertyIdentifier,
+                apdu.propertyArrayIndex,
+                vendor_id=vendor_id,
             )
-            if not datatype:
-                # raise TypeError("unknown datatype")
-                value = cast_datatype_from_tag(
-                    apdu.propertyValue,
-                    apdu.objectIdentifier[0],
-                    apdu.propertyIdentifier,
-                )
-            else:
-                # special case for array parts, others are managed by cast_out
-                if issubclass(datatype, Array) and (
-                    apdu.propertyArrayIndex is not None
-                ):
-                    if apdu.propertyArrayIndex == 0:
-                        value = apdu.propertyValue.cast_out(Unsigned)
-                    else:
-                        value = apdu.propertyValue.cast_out(datatype.subtype)
-                else:
-                    value = apdu.propertyValue.cast_out(datatype)
-
-                self._log.debug("{:<20} {:<20}".format("value", "datatype"))
-                self._log.debug("{!r:<20} {!r:<20}".format(value, datatype))
+            if datatype:
+                self._log.debug("%-20s %-20s", "value", "datatype")
+                self._log.debug("%-20r %-20r", value, datatype)
             if not show_property_name:
                 return value
 
@@ -229,9 +499,119 @@ class ReadProperty:
         This can be a very long process as some devices count a large
         number of properties without supporting segmentation
         (FieldServers are a good example)
+
+        To limit the number of round-trips, the length (index 0) and the
+        first elements are requested together using ReadPropertyMultiple,
+        then the remaining elements are requested in chunks. If the device
+        refuses a request because the answer is too large, or answers the
+        first request with an error (the array can be shorter than the
+        indexes asked), the chunk size is halved until elements are read one
+        by one. A device that doesn't answer raises NoResponseFromController
+        right away.
+        """
+        if not isinstance(args, str):
+            # request made with read_tuple()
+            args = " ".join(str(arg) for arg in args)
+        rp_args = " ".join(args.split()[:4])
+
+        chunk_size = SPLIT_READ_CHUNK_SIZE
+        head = None
+        try:
+            # no answer at all raises. A refusal or an error answer (the array
+            # may be shorter than the indexes asked) makes the chunk smaller.
+            while chunk_size >= 1 and head is None:
+                head = self._read_array_indexes(args, list(range(chunk_size + 1)))
+                if head is None or head is _READ_ONE_BY_ONE:
+                    head = None
+                    chunk_size //= 2
+        except UnrecognizedService:
+            head = None
+
+        if head is None or not isinstance(head[0], int):
+            # ReadPropertyMultiple is of no help, read elements one by one
+            nmbr_obj = self.read(rp_args, arr_index=0)
+            return [self.read(rp_args, arr_index=i) for i in range(1, nmbr_obj + 1)]
+
+        nmbr_obj = head[0]
+        values = head[1 : nmbr_obj + 1]
+        if nmbr_obj > chunk_size:
+            values.extend(
+                self._read_array_elements(
+                    args, list(range(chunk_size + 1, nmbr_obj + 1)), chunk_size
+                )
+            )
+        return values
+
+    def _read_array_elements(self, args, indexes, chunk_size):
+        """
+        Read the elements at indexes of an array property, chunk_size
+        elements per ReadPropertyMultiple request.
+        """
+        rp_args = " ".join(args.split()[:4])
+        values = []
+        for start in range(0, len(indexes), chunk_size):
+            chunk = indexes[start : start + chunk_size]
+            if chunk_size == 1:
+                values.extend(self.read(rp_args, arr_index=idx) for idx in chunk)
+                continue
+            try:
+                result = self._read_array_indexes(args, chunk)
+            except UnrecognizedService:
+                # ReadPropertyMultiple not supported, read the rest one by one
+                return values + self._read_array_elements(args, indexes[start:], 1)
+
+            if result is _READ_ONE_BY_ONE:
+                values.extend(self._read_array_elements(args, chunk, 1))
+            elif result is not None:
+                values.extend(result)
+            else:
+                self._log.debug(
+                    "Chunk of %s elements refused, retrying with %s",
+                    chunk_size,
+                    chunk_size // 2,
+                )
+                values.extend(self._read_array_elements(args, chunk, chunk_size // 2))
+        return values
+
+    def _read_array_indexes(self, args, indexes):
         """
-        nmbr_obj = self.read(args, arr_index=0)
-        return [self.read(args, arr_index=i) for i in range(1, nmbr_obj + 1)]
+        Read the elements at indexes of an array property using a single
+        ReadPropertyMultiple request. Returns None if the device refused it
+        because the answer would be too large, _READ_ONE_BY_ONE if the request
+        can't be built or the device answered with an error. A device that
+        doesn't answer raises NoResponseFromController.
+        """
+        try:
+            addr, obj_type, obj_inst, prop_id = parse_rp_args(args.split())
+            request = self.build_rpm_request_from_specs(
+                addr, [(obj_type, obj_inst, [(prop_id, idx) for idx in indexes])]
+            )
+        except ValueError as error:
+            self._log.debug("Can't build the request for %s : %r", args, error)
+            return _READ_ONE_BY_ONE
+
+        iocb = self._submit_request(request)
+        iocb.wait()  # Wait for BACnet response
+        if iocb.ioError:
+            reason = find_reason(iocb.ioError)
+            if reason in _SIZE_ABORT_REASONS:
+                if reason == "segmentationNotSupported":
+                    self.segmentation_supported = False
+                return None
+            elif reason == "unrecognizedService":
+                raise UnrecognizedService()
+            elif reason == "unknownObject":
+                raise UnknownObjectError("Unknown object {}".format(args))
+            elif isinstance(iocb.ioError, ErrorPDU):
+                # the device answered (invalidArrayIndex, unknownProperty...)
+                self._log.debug("Chunk of %s read : %s", args, reason)
+                return _READ_ONE_BY_ONE
+            raise NoResponseFromController("APDU Abort Reason : {}".format(reason))
+
+        result = self._process_read_multiple_response(iocb, args)
+        if result is None or len(result) != len(indexes):
+            return None
+        return result
 
     def readMultiple(
         self, args, request_dict=None, vendor_id=0, timeout=10, show_property_name=False
@@ -251,6 +631,90 @@ class ReadProperty:
         Requests the controller at (Network 2, address 5) for the (presentValue and units) of
         its analog input 1 (AI:1).
         """
+        iocb = self._submit_read_multiple(
+            args, request_dict=request_dict, vendor_id=vendor_id, timeout=timeout
+        )
+        iocb.wait()  # Wait for BACnet response
+        return self._process_read_multiple_response(
+            iocb,
+            args,
+            request_dict=request_dict,
+            vendor_id=vendor_id,
+            show_property_name=show_property_name,
+        )
+
+    async def readMultiple_async(
+        self, args, request_dict=None, vendor_id=0, timeout=10, show_property_name=False
+    ):
+        """
+        Coroutine version of readMultiple(). The calling thread is not blocked
+        while the request is pending so multiple requests can be awaited
+        together. Like read_async(), requests to the same device are sent one
+        after the other and each timeout starts when its request is sent.
+
+        *Example*::
+
+            values = await asyncio.gather(
+                bacnet.readMultiple_async('2:5 analogInput 1 presentValue units'),
+                bacnet.readMultiple_async('2:6 analogInput 1 presentValue units'),
+            )
+        """
+        if request_dict is not None:
+            addr = request_dict["address"]
+        else:
+            addr = args.split()[0]
+        async with self._destination_lock(addr):
+            iocb = self._submit_read_multiple(
+                args, request_dict=request_dict, vendor_id=vendor_id, timeout=None
+            )
+            await self._await_iocb(iocb, timeout=timeout)
+        return self._process_read_multiple_response(
+            iocb,
+            args,
+            request_dict=request_dict,
+            vendor_id=vendor_id,
+            show_property_name=show_property_name,
+        )
+
+    def readMultiple_spec(
+        self, addr, specs, vendor_id=0, timeout=10, show_property_name=False
+    ):
+        """
+        Same as readMultiple() but using already parsed arguments instead of a string.
+
+        :param addr: address of the device
+        :param specs: list of (<type>, <inst>, [(<prop>, <indx>), ...]) where
+            <indx> is None when not reading an array element. <type> and <prop>
+            can be names or numeric identifiers (int).
+
+        *Example*::
+
+            bacnet.readMultiple_spec(
+                '2:5',
+                [('analogInput', 1, [('presentValue', None), ('units', None)])],
+            )
+        """
+        if not self._started:
+            raise ApplicationNotStarted("BACnet stack not running - use startApp()")
+
+        iocb = self._submit_request(
+            self.build_rpm_request_from_specs(addr, specs, vendor_id=vendor_id),
+            timeout=timeout,
+        )
+        iocb.wait()  # Wait for BACnet response
+        return self._process_read_multiple_response(
+            iocb,
+            (addr, specs),
+            vendor_id=vendor_id,
+            show_property_name=show_property_name,
+        )
+
+    def _submit_read_multiple(self, args, request_dict=None, vendor_id=0, timeout=10):
+        """
+        Build a ReadPropertyMultiple request and pass it to the BACnet stack.
+        Returns the IOCB that will hold the answer. With timeout=None, no
+        timer is armed on the IOCB and the caller handles the timeout.
+        """
         if not self._started:
             raise ApplicationNotStarted("BACnet stack not running - use startApp()")
 
@@ -261,49 +725,56 @@ class ReadProperty:
             request = self.build_rpm_request(args, vendor_id=vendor_id)
             self.log_title("Read Multiple", args)
 
-        values = []
-        dict_values = {}
-
         try:
-            # build an ReadPropertyMultiple request
-            iocb = IOCB(request)
-            iocb.set_timeout(timeout)
-            # pass to the BACnet stack
-            deferred(self.this_application.request_io, iocb)
-            self._log.debug("{:<20} {!r}".format("iocb", iocb))
+            iocb = self._submit_request(request, timeout=timeout)
 
         except ReadPropertyMultipleException as error:
             # construction error
             self._log.exception("exception: {!r}".format(error))
 
-        iocb.wait()  # Wait for BACnet response
+        return iocb
+
+    def _process_read_multiple_response(
+        self, iocb, args, request_dict=None, vendor_id=0, show_property_name=False
+    ):
+        """
+        Decode the answer of a completed ReadPropertyMultiple IOCB
+        """
+        values = []
+        dict_values = {}
 
         if iocb.ioResponse:  # successful response
             apdu = iocb.ioResponse
 
             if not isinstance(apdu, ReadPropertyMultipleACK):  # expecting an ACK
-                self._log.debug("{:<20}".format("not an ack"))
+                self._log.debug("%-20s", "not an ack")
                 self._log.warning(
                     "Not an Ack. | APDU : {} / {}".format((apdu, type(apdu)))
                 )
                 return
 
+            # local aliases, looked up once for the whole loop
+            values_append = values.append
+            log_debug = self._log.debug
+            cast_value = self._cast_value
+
             # loop through the results
             for result in apdu.listOfReadAccessResults:
                 # here is the object identifier
                 objectIdentifier = result.objectIdentifier
-
-                self.log_subtitle(
-                    "{!r} : {!r}".format(objectIdentifier[0], objectIdentifier[1]),
-                    width=114,
-                )
-                self._log.debug(
-                    "{:<20} {:<20} {:<30} {:<20}".format(
-                        "propertyIdentifier", "propertyArrayIndex", "value", "datatype"
-                    )
+                obj_type = objectIdentifier[0]
+
+                self.log_subtitle("%r : %r", width=114, subtitle_args=objectIdentifier)
+                log_debug(
+                    "%-20s %-20s %-30s %-20s",
+                    "propertyIdentifier",
+                    "propertyArrayIndex",
+                    "value",
+                    "datatype",
                 )
-                self._log.debug("-" * 114)
-                dict_values[objectIdentifier] = []
+                log_debug("-" * 114)
+                object_values = dict_values[objectIdentifier] = []
+                object_values_append = object_values.append
                 # now come the property values per object
                 for element in result.listOfResults:
                     # get the property and array index
@@ -320,47 +791,30 @@ class ReadProperty:
                         _prop_id = propertyIdentifier
 
                     if readResult.propertyAccessError is not None:
-                        self._log.debug(
-                            "Property Access Error for {}".format(
-                                readResult.propertyAccessError
-                            )
+                        log_debug(
+                            "Property Access Error for %s",
+                            readResult.propertyAccessError,
                         )
-                        values.append(None)
-                        dict_values[objectIdentifier].append((_prop_id, None))
+                        values_append(None)
+                        object_values_append((_prop_id, None))
                     else:
                         # here is the value
                         propertyValue = readResult.propertyValue
 
-                        # find the datatype
-                        datatype = get_datatype(
-                            objectIdentifier[0], propertyIdentifier, vendor_id=vendor_id
+                        value, datatype = cast_value(
+                            propertyValue,
+                            obj_type,
+                            propertyIdentifier,
+                            propertyArrayIndex,
+                            vendor_id=vendor_id,
                         )
-
-                        if not datatype:
-                            value = cast_datatype_from_tag(
-                                propertyValue, objectIdentifier[0], propertyIdentifier
-                            )
-                        else:
-                            # special case for array parts, others are managed by cast_out
-                            if issubclass(datatype, Array) and (
-                                propertyArrayIndex is not None
-                            ):
-                                if propertyArrayIndex == 0:
-                                    value = propertyValue.cast_out(Unsigned)
-                                else:
-                                    value = propertyValue.cast_out(datatype.subtype)
-                            elif propertyValue.is_application_class_null():
-                                value = None
-                            else:
-                                value = propertyValue.cast_out(datatype)
-
-                            self._log.debug(
-                                "{!r:<20} {!r:<20} {!r:<30} {!r:<20}".format(
-                                    propertyIdentifier,
-                                    propertyArrayIndex,
-                                    value,
-                                    datatype,
-                                )
+                        if datatype:
+                            log_debug(
+                                "%-20r %-20r %-30r %-20r",
+                                propertyIdentifier,
+                                propertyArrayIndex,
+                                value,
+                                datatype,
                             )
                         if show_property_name:
                             try:
@@ -384,13 +838,11 @@ class ReadProperty:
 
                             except ValueError:
                                 prop_id = propertyIdentifier
-                            values.append((value, prop_id))
-                            dict_values[objectIdentifier].append(
-                                (_prop_id, (value, prop_id))
-                            )
+                            values_append((value, prop_id))
+                            object_values_append((_prop_id, (value, prop_id)))
                         else:
-                            values.append(value)
-                            dict_values[objectIdentifier].append((_prop_id, value))
+                            values_append(value)
+                            object_values_append((_prop_id, value))
 
             if request_dict is not None:
                 return dict_values
@@ -401,7 +853,7 @@ class ReadProperty:
             apdu = iocb.ioError
             reason = find_reason(apdu)
             self._log.warning("APDU Abort Reject Reason : {}".format(reason))
-            self._log.debug("The Request was : {}".format(args))
+            self._log.debug("The Request was : %s", args)
             if reason == "unrecognizedService":
                 raise UnrecognizedService()
             elif reason == "segmentationNotSupported":
@@ -423,25 +875,24 @@ class ReadProperty:
                 return values
 
     def build_rp_request(self, args, arr_index=None, vendor_id=0, bacoid=None):
-        addr, obj_type, obj_inst, prop_id = args[:4]
+        addr, obj_type, obj_inst, prop_id = parse_rp_args(args)
         vendor_id = vendor_id
         bacoid = bacoid
 
-        if obj_type.isdigit():
-            obj_type = int(obj_type)
-        elif "@obj_" in obj_type:
-            obj_type = int(obj_type.split("_")[1])
-        elif not get_object_class(obj_type, vendor_id=vendor_id):
-            raise ValueError("Unknown object type : {}".format(obj_type))
-
-        obj_inst = int(obj_inst)
+        if len(args) == 5:
+            arr_index = int(args[4])
 
-        if prop_id.isdigit():
-            prop_id = int(prop_id)
-        elif "@prop_" in prop_id:
-            prop_id = int(prop_id.split("_")[1])
+        return self.build_rp_request_from_tuple(
+            addr, obj_type, obj_inst, prop_id, arr_index=arr_index, vendor_id=vendor_id
+        )
 
-        # datatype = get_datatype(obj_type, prop_id, vendor_id=vendor_id)
+    def build_rp_request_from_tuple(
+        self, addr, obj_type, obj_inst, prop_id, arr_index=None, vendor_id=0
+    ):
+        """
+        Build a ReadProperty request from already parsed arguments
+        """
+        obj_type = validate_object_type(obj_type, vendor_id=vendor_id)
 
         # build a request
         request = ReadPropertyRequest(
@@ -449,104 +900,34 @@ class ReadProperty:
             propertyIdentifier=prop_id,
             propertyArrayIndex=arr_index,
         )
-        request.pduDestination = Address(addr)
+        request.pduDestination = _address(addr)
 
-        if len(args) == 5:
-            request.propertyArrayIndex = int(args[4])
-        self._log.debug("{:<20} {!r}".format("REQUEST", request))
+        self._log.debug("%-20s %r", "REQUEST", request)
         return request
 
     def build_rpm_request(self, args, vendor_id=0):
         """
         Build request from args
         """
-        self._log.debug(args)
-        i = 0
-        addr = args[i]
-        i += 1
-        vendor_id = vendor_id
-
-        read_access_spec_list = []
-        while i < len(args):
-            obj_type = args[i]
-            i += 1
-
-            if obj_type.isdigit():
-                obj_type = int(obj_type)
-            elif "@obj_" in obj_type:
-                obj_type = int(obj_type.split("_")[1])
-            elif not get_object_class(obj_type, vendor_id=vendor_id):
-                raise ValueError("Unknown object type : {}".format(obj_type))
-
-            obj_inst = int(args[i])
-            i += 1
-
-            prop_reference_list = []
-            while i < len(args):
-                prop_id = args[i]
-                if "@obj_" in prop_id:
-                    break
-                if prop_id not in PropertyIdentifier.enumerations:
-                    try:
-                        if "@prop_" in prop_id:
-                            prop_id = int(prop_id.split("_")[1])
-                            self._log.debug(
-                                "Proprietary property : {} | {} -> Vendor : {}".format(
-                                    obj_type, prop_id, vendor_id
-                                )
-                            )
-                        else:
-                            break
-                    except:
-                        break
-
-                elif prop_id not in (
-                    "all",
-                    "required",
-                    "optional",
-                    "objectName",
-                    "objectType",
-                    "objectIdentifier",
-                    "polarity",
-                ):
-                    datatype = get_datatype(obj_type, prop_id, vendor_id=vendor_id)
-                    if not datatype:
-                        raise ValueError(
-                            "invalid property for object type : {} | {}".format(
-                                obj_type, prop_id
-                            )
-                        )
-                i += 1
-
-                # build a property reference
-                prop_reference = PropertyReference(propertyIdentifier=prop_id)
-
-                # check for an array index
-                if (i < len(args)) and args[i].isdigit():
-                    prop_reference.propertyArrayIndex = int(args[i])
-                    i += 1
-
-                prop_reference_list.append(prop_reference)
-
-            if not prop_reference_list:
-                raise ValueError("provide at least one property")
-
-            # build a read access specification
-            read_access_spec = ReadAccessSpecification(
-                objectIdentifier=(obj_type, obj_inst),
-                listOfPropertyReferences=prop_reference_list,
-            )
+        self._log.debug("%s", args)
+        # specs are memoized, the request itself must be unique
+        request = ReadPropertyMultipleRequest(
+            listOfReadAccessSpecs=list(_compile_rpm(tuple(args[1:]), vendor_id))
+        )
+        request.pduDestination = _address(args[0])
+        return request
 
-            read_access_spec_list.append(read_access_spec)
+    def build_rpm_request_from_specs(self, addr, specs, vendor_id=0):
+        """
+        Build request from already parsed arguments::
 
-        if not read_access_spec_list:
-            raise RuntimeError("at least one read access specification required")
+            [(<type>, <inst>, [(<prop>, <indx>), ...]), ...]
 
-        # build the request
+        """
         request = ReadPropertyMultipleRequest(
-            listOfReadAccessSpecs=read_access_spec_list
+            listOfReadAccessSpecs=build_read_access_spec_list(specs, vendor_id)
         )
-        request.pduDestination = Address(addr)
+        request.pduDestination = _address(addr)
         return request
 
     def build_rpm_request_from_dict(self, request_dict, vendor_id):
@@ -592,7 +973,7 @@ class ReadProperty:
         request = ReadPropertyMultipleRequest(
             listOfReadAccessSpecs=read_access_spec_list
         )
-        request.pduDestination = Address(addr)
+        request.pduDestination = _address(addr)
 
         return request
 
@@ -606,14 +987,14 @@ class ReadProperty:
 
         if obj_type.isdigit():
             obj_type = int(obj_type)
-        elif not get_object_class(obj_type, vendor_id=vendor_id):
+        elif not _get_object_class(obj_type, vendor_id=vendor_id):
             raise ValueError("Unknown object type {}".format(obj_type))
 
         obj_inst = int(obj_inst)
 
         if prop_id.isdigit():
             prop_id = int(prop_id)
-        datatype = get_datatype(obj_type, prop_id, vendor_id=vendor_id)
+        datatype = _get_datatype(obj_type, prop_id, vendor_id=vendor_id)
         if not datatype:
             raise ValueError("invalid property for object type")
 
@@ -621,7 +1002,7 @@ class ReadProperty:
         request = ReadRangeRequest(
             objectIdentifier=(obj_type, obj_inst), propertyIdentifier=prop_id
         )
-        request.pduDestination = Address(addr)
+        request.pduDestination = _address(addr)
         if range_params is not None:
             range_type, first, date, time, count = range_params
             if range_type == "p":
@@ -698,7 +1079,7 @@ class ReadProperty:
             iocb = IOCB(request)
             iocb.set_timeout(timeout)
             # pass to the BACnet stack
-            deferred(self.this_application.request_io, iocb)
+            deferred(self._request_io, iocb)
             self._log.debug("{:<20} {!r}".format("iocb", iocb))
 
         except ReadRangeException as error:
@@ -718,7 +1099,7 @@ class ReadProperty:
                 return
 
             # find the datatype
-            datatype = get_datatype(
+            datatype = _get_datatype(
                 apdu.objectIdentifier[0], apdu.propertyIdentifier, vendor_id=vendor_id
             )
             if not datatype:
@@ -777,6 +1158,25 @@ class ReadProperty:
                         "APDU Abort Reason : {}".format(reason)
                     )
 
+    @staticmethod
+    def _cast_value(propertyValue, obj_type, prop_id, arr_index, vendor_id=0):
+        """
+        Cast a property value read from a device.
+        Returns (value, datatype), datatype being None when unknown by bacpypes.
+        """
+        datatype, is_array, subtype = _cast_target(obj_type, prop_id, vendor_id)
+        if not datatype:
+            return cast_datatype_from_tag(propertyValue, obj_type, prop_id), None
+        # special case for array parts, others are managed by cast_out
+        if is_array and arr_index is not None:
+            return (
+                propertyValue.cast_out(Unsigned if arr_index == 0 else subtype),
+                datatype,
+            )
+        if propertyValue.is_application_class_null():
+            return None, datatype
+        return propertyValue.cast_out(datatype), datatype
+
     def read_priority_array(self, addr, obj, obj_instance):
         pa = self.read("{} {} {} priorityArray".format(addr, obj, obj_instance))
         res = [pa]
@@ -788,28 +1188,6 @@ class ReadProperty:
         return res
 
 
-def find_reason(apdu):
-    try:
-        if apdu == TimeoutError:
-            return "Timeout"
-        elif apdu.pduType == RejectPDU.pduType:
-            reasons = RejectReason.enumerations
-        elif apdu.pduType == AbortPDU.pduType:
-            reasons = AbortReason.enumerations
-        else:
-            if apdu.errorCode and apdu.errorClass:
-                return "{}".format(apdu.errorCode)
-            else:
-                raise ValueError("Cannot find reason...")
-        code = apdu.apduAbortRejectReason
-        try:
-            return [k for k, v in reasons.items() if v == code][0]
-        except IndexError:
-            return code
-    except KeyError as err:
-        return "KeyError: {} has no key {0!r}".format(type(apdu), err.args[0])
-
-
 def cast_datatype_from_tag(propertyValue, obj_id, prop_id):
     try:
         tag_list = propertyValue.tagList.tagList
@@ -828,23 +1206,6 @@ def cast_datatype_from_tag(propertyValue, obj_id, prop_id):
     return value
 
 
-def validate_object_type(obj_type, vendor_id=842):
-    if obj_type.isdigit():
-        obj_type = int(obj_type)
-    elif "@obj_" in obj_type:
-        obj_type = int(obj_type.split("_")[1])
-    elif not get_object_class(obj_type, vendor_id=vendor_id):
-        raise ValueError("Unknown object type : {}".format(obj_type))
-    return obj_type
-
-
-def build_read_access_spec(obj_type, obj_instance, property_reference_list):
-    return ReadAccessSpecification(
-        objectIdentifier=(obj_type, obj_instance),
-        listOfPropertyReferences=property_reference_list,
-    )
-
-
 def build_property_reference_list(obj_type, list_of_properties):
     property_reference_list = []
     for prop in list_of_properties:
@@ -860,16 +1221,8 @@ def build_property_reference_list(obj_type, list_of_properties):
 
 
 def validate_property_id(obj_type, prop_id):
-    if prop_id in PropertyIdentifier.enumerations:
-        if prop_id in (
-            "all",
-            "required",
-            "optional",
-            "objectName",
-            "objectType",
-            "objectIdentifier",
-            "polarity",
-        ):
+    if prop_id in _PROP_ENUMS:
+        if prop_id in _UNCHECKED_PROPS:
             return prop_id
         elif validate_datatype(obj_type, prop_id) is not None:
             return prop_id
@@ -884,4 +1237,4 @@ def validate_property_id(obj_type, prop_id):
 
 
 def validate_datatype(obj_type, prop_id, vendor_id=842):
-    return get_datatype(obj_type, prop_id, vendor_id=vendor_id) if not None else False
+    return _get_datatype(obj_type, prop_id, vendor_id=vendor_id) if not None else False
@@ -0,0 +1,252 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015 by Christian Tremblay, P.Eng <christian.tremblay@servisys.com>
+# Licensed under LGPLv3, see file LICENSE in this source tree.
+#
+"""
+_read_fast.py - parsing and lookup helpers used for every Read request
+
+    This module is pure Python, annotated with the types callers actually
+    pass so it can be compiled with mypyc without changing its behaviour.
+    Read.py imports everything it needs from here.
+
+"""
+
+# --- standard Python modules ---
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+# --- 3rd party modules ---
+from bacpypes.pdu import Address
+from bacpypes.object import get_object_class, get_datatype
+from bacpypes.apdu import (
+    PropertyReference,
+    ReadAccessSpecification,
+    RejectReason,
+    AbortReason,
+    RejectPDU,
+    AbortPDU,
+)
+from bacpypes.basetypes import PropertyIdentifier
+from bacpypes.constructeddata import Array
+from bacpypes.iocb import TimeoutError
+
+# ------------------------------------------------------------------------------
+
+Identifier = Union[int, str]
+
+# Datatype and object class lookups walk the bacpypes registry and are
+# requested for every property read, so they are memoized.
+# clear_datatype_cache() must be called when new object types are registered.
+_get_datatype = lru_cache(maxsize=4096)(get_datatype)
+_get_object_class = lru_cache(maxsize=512)(get_object_class)
+
+
+def clear_datatype_cache() -> None:
+    """
+    Forget memoized datatype and object class lookups, and what was
+    built from them
+    """
+    _get_datatype.cache_clear()
+    _get_object_class.cache_clear()
+    _cast_target.cache_clear()
+    _compile_rpm.cache_clear()
+
+
+@lru_cache(maxsize=4096)
+def _cast_target(
+    obj_type: Identifier, prop_id: Identifier, vendor_id: int = 0
+) -> Tuple[Any, bool, Any]:
+    """
+    Returns (datatype, is_array, subtype) used to cast a property value.
+    datatype is None when unknown.
+    """
+    datatype = _get_datatype(obj_type, prop_id, vendor_id=vendor_id)
+    if datatype is not None and issubclass(datatype, Array):
+        return (datatype, True, datatype.subtype)
+    return (datatype, False, None)
+
+
+@lru_cache(maxsize=256)
+def _address(addr: Any) -> Address:
+    """
+    Address parsing is done once per device. bacpypes doesn't modify the
+    destination of a PDU so the same object can be used for every request.
+    """
+    return Address(addr)
+
+
+# Property names known by bacpypes, and the ones accepted in RPM requests
+# without validating their datatype against the object type
+_PROP_ENUMS = frozenset(PropertyIdentifier.enumerations)
+_UNCHECKED_PROPS = frozenset(
+    (
+        "all",
+        "required",
+        "optional",
+        "objectName",
+        "objectType",
+        "objectIdentifier",
+        "polarity",
+    )
+)
+
+# Reject and abort reason names, by numeric code
+_REJECT_REASON_BY_CODE = {v: k for k, v in RejectReason.enumerations.items()}
+_ABORT_REASON_BY_CODE = {v: k for k, v in AbortReason.enumerations.items()}
+
+
+def find_reason(apdu: Any) -> Any:
+    try:
+        if apdu == TimeoutError:
+            return "Timeout"
+        elif apdu.pduType == RejectPDU.pduType:
+            reasons = _REJECT_REASON_BY_CODE
+        elif apdu.pduType == AbortPDU.pduType:
+            reasons = _ABORT_REASON_BY_CODE
+        else:
+            if apdu.errorCode and apdu.errorClass:
+                return "{}".format(apdu.errorCode)
+            else:
+                raise ValueError("Cannot find reason...")
+        code = apdu.apduAbortRejectReason
+        return reasons.get(code, code)
+    except KeyError as err:
+        return "KeyError: {} has no key {!r}".format(type(apdu), err.args[0])
+
+
+def validate_object_type(obj_type: Identifier, vendor_id: int = 842) -> Identifier:
+    if isinstance(obj_type, int):
+        # numeric identifier, nothing to look up
+        return obj_type
+    if obj_type.isdigit():
+        return int(obj_type)
+    elif "@obj_" in obj_type:
+        return int(obj_type.split("_")[1])
+    elif not _get_object_class(obj_type, vendor_id=vendor_id):
+        raise ValueError("Unknown object type : {}".format(obj_type))
+    return obj_type
+
+
+def parse_rp_args(args: Sequence[str]) -> Tuple[Any, str, int, Identifier]:
+    """
+    Parse the string arguments <addr> <type> <inst> <prop> of a ReadProperty
+    request. The object type is validated when the request is built.
+    """
+    addr, obj_type, obj_inst, prop_id = args[:4]
+    if prop_id.isdigit():
+        return (addr, obj_type, int(obj_inst), int(prop_id))
+    elif "@prop_" in prop_id:
+        return (addr, obj_type, int(obj_inst), int(prop_id.split("_")[1]))
+    return (addr, obj_type, int(obj_inst), prop_id)
+
+
+def parse_rpm_args(
+    args: Sequence[str], vendor_id: int = 0
+) -> List[Tuple[Identifier, int, List[Tuple[Identifier, Optional[int]]]]]:
+    """
+    Parse the string arguments of a ReadPropertyMultiple request (without the
+    address) into [(<type>, <inst>, [(<prop>, <indx>), ...]), ...]
+    """
+    n = len(args)
+    i = 0
+
+    specs = []
+    while i < n:
+        obj_type = validate_object_type(args[i], vendor_id=vendor_id)
+        i += 1
+
+        obj_inst = int(args[i])
+        i += 1
+
+        properties: List[Tuple[Identifier, Optional[int]]] = []
+        while i < n:
+            token = args[i]
+            prop_id: Identifier = token
+            if "@obj_" in token:
+                break
+            if token not in _PROP_ENUMS:
+                try:
+                    if "@prop_" in token:
+                        prop_id = int(token.split("_")[1])
+                    else:
+                        break
+                except:
+                    break
+
+            elif token not in _UNCHECKED_PROPS:
+                datatype = _get_datatype(obj_type, token, vendor_id=vendor_id)
+                if not datatype:
+                    raise ValueError(
+                        "invalid property for object type : {} | {}".format(
+                            obj_type, token
+                        )
+                    )
+            i += 1
+
+            # check for an array index
+            arr_index = None
+            if (i < n) and args[i].isdigit():
+                arr_index = int(args[i])
+                i += 1
+
+            properties.append((prop_id, arr_index))
+
+        if not properties:
+            raise ValueError("provide at least one property")
+
+        specs.append((obj_type, obj_inst, properties))
+    return specs
+
+
+def build_read_access_spec_list(
+    specs: Sequence[Any], vendor_id: int = 0
+) -> List[ReadAccessSpecification]:
+    read_access_spec_list = []
+    for obj_type, obj_inst, properties in specs:
+        obj_type = validate_object_type(obj_type, vendor_id=vendor_id)
+
+        prop_reference_list = []
+        for prop_id, arr_index in properties:
+            # build a property reference
+            prop_reference = PropertyReference(propertyIdentifier=prop_id)
+            if arr_index is not None:
+                prop_reference.propertyArrayIndex = arr_index
+            prop_reference_list.append(prop_reference)
+
+        if not prop_reference_list:
+            raise ValueError("provide at least one property")
+
+        # build a read access specification
+        read_access_spec_list.append(
+            build_read_access_spec(obj_type, obj_inst, prop_reference_list)
+        )
+
+    if not read_access_spec_list:
+        raise RuntimeError("at least one read access specification required")
+    return read_access_spec_list
+
+
+@lru_cache(maxsize=256)
+def _compile_rpm(
+    args: Tuple[str, ...], vendor_id: int = 0
+) -> Tuple[ReadAccessSpecification, ...]:
+    """
+    Periodic polls send the same ReadPropertyMultiple requests over and over.
+    The read access specifications built from the arguments (a tuple, without
+    the address) are memoized. They are only read when a request is encoded
+    so they can be shared by many requests.
+    """
+    return tuple(
+        build_read_access_spec_list(parse_rpm_args(args, vendor_id), vendor_id)
+    )
+
+
+def build_read_access_spec(
+    obj_type: Identifier, obj_instance: Identifier, property_reference_list: List[Any]
+) -> ReadAccessSpecification:
+    return ReadAccessSpecification(
+        objectIdentifier=(obj_type, obj_instance),
+        listOfPropertyReferences=property_reference_list,
+    )
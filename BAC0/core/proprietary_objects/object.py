@@ -5,6 +5,8 @@ from bacpypes.object import (
     registered_object_types,
 )
 
+from ..io._read_fast import clear_datatype_cache
+
 # Prochaine étape : créer une focntion qui va lire "all" et se redéfinir dynamiquement
 def create_proprietary_object(params):
     try:
@@ -22,6 +24,7 @@ def create_proprietary_object(params):
         {"objectType": params["objectType"], "properties": props},
     )
     register_object_type(new_class, vendor_id=params["vendor_id"])
+    clear_datatype_cache()
     if "BAC0" not in registered_object_types.keys():
         registered_object_types["BAC0"] = {}
 
@@ -229,19 +229,23 @@ def note_and_log(cls):
     def log_title(self, title, args=None, width=35):
         cls._log.debug("")
         cls._log.debug("#" * width)
-        cls._log.debug("# {}".format(title))
+        cls._log.debug("# %s", title)
         cls._log.debug("#" * width)
         if args:
-            cls._log.debug("{!r}".format(args))
+            cls._log.debug("%r", args)
             cls._log.debug("#" * 35)
 
-    def log_subtitle(self, subtitle, args=None, width=35):
+    def log_subtitle(self, subtitle, args=None, width=35, subtitle_args=()):
         cls._log.debug("")
         cls._log.debug("=" * width)
-        cls._log.debug("{}".format(subtitle))
+        if subtitle_args:
+            # subtitle is a format string, only formatted if emitted
+            cls._log.debug(subtitle, *subtitle_args)
+        else:
+            cls._log.debug("%s", subtitle)
         cls._log.debug("=" * width)
         if args:
-            cls._log.debug("{!r}".format(args))
+            cls._log.debug("%r", args)
             cls._log.debug("=" * width)
 
     def log(self, note, *, level=logging.DEBUG):
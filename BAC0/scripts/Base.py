@@ -235,6 +235,8 @@ class Base:
                     subscription_contexts=self.subscription_contexts,
                 )
                 app_type = "Simple BACnet/IP App"
+            # bound once, used to pass every read request to the stack
+            self._request_io = self.this_application.request_io
             self._log.debug("Starting")
             self._initialized = True
             try:
@@ -4,7 +4,7 @@ Setup.py
 from setuptools import setup
 from BAC0 import infos
 
-requirements = ["bacpypes", "colorama"]
+requirements = ["bacpypes", "colorama", "async_timeout"]
 
 setup(
     name="BAC0",
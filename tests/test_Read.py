@@ -5,12 +5,29 @@
 Test Bacnet communication with another device
 """
 
+import asyncio
+import threading
+
+import pytest
+
+from bacpypes.apdu import AbortPDU, Error
+from bacpypes.basetypes import PropertyIdentifier
+from bacpypes.primitivedata import ObjectType
+from bacpypes.iocb import IOCB, ABORTED, TimeoutError
+
+from BAC0.core.io import Read
+from BAC0.core.io.Read import ReadProperty
+from BAC0.core.io._read_fast import parse_rpm_args
+from BAC0.core.io.IOExceptions import NoResponseFromController, UnrecognizedService
+
 CHANGE_DELTA_AI = 99.90
 CHANGE_DELTA_AO = 89.90
 CHANGE_DELTA_AV = 79.90
 TOLERANCE = 0.01
 BINARY_TEST_STATE = "inactive"
 CHARACTERSTRINGVALUE = "test"
+SPLIT_ARGS = "2:5 device 5 objectList"
+AI_ARGS = "2:5 analogInput 1 presentValue"
 
 
 def test_ReadAV(network_and_devices):
@@ -52,3 +69,437 @@ def test_ReadBO(network_and_devices):
 def test_ReadCharacterstringValue(network_and_devices):
     test_device = network_and_devices.test_device
     assert test_device["CS_VALUE"].value == CHARACTERSTRINGVALUE
+
+
+def test_ReadTuple(network_and_devices):
+    bacnet = network_and_devices.bacnet
+    test_device = network_and_devices.test_device
+    addr = test_device.properties.address
+    point = test_device["AI"]
+    obj_type = point.properties.type
+    obj_inst = int(point.properties.address)
+
+    value = bacnet.read("{} {} {} presentValue".format(addr, obj_type, obj_inst))
+    assert bacnet.read_tuple(addr, obj_type, obj_inst, "presentValue") == value
+    assert (
+        bacnet.read_tuple(
+            addr,
+            ObjectType.enumerations[obj_type],
+            obj_inst,
+            PropertyIdentifier.enumerations["presentValue"],
+        )
+        == value
+    )
+
+
+def test_ReadMultipleSpec(network_and_devices):
+    bacnet = network_and_devices.bacnet
+    test_device = network_and_devices.test_device
+    addr = test_device.properties.address
+    point = test_device["AI"]
+    obj_type = point.properties.type
+    obj_inst = int(point.properties.address)
+
+    values = bacnet.readMultiple(
+        "{} {} {} presentValue units objectName".format(addr, obj_type, obj_inst)
+    )
+    named = [
+        (
+            obj_type,
+            obj_inst,
+            [("presentValue", None), ("units", None), ("objectName", None)],
+        )
+    ]
+    assert bacnet.readMultiple_spec(addr, named) == values
+
+    numeric = [
+        (
+            ObjectType.enumerations[obj_type],
+            obj_inst,
+            [
+                (PropertyIdentifier.enumerations[prop_id], None)
+                for prop_id in ("presentValue", "units", "objectName")
+            ],
+        )
+    ]
+    assert bacnet.readMultiple_spec(addr, numeric) == values
+
+
+def test_ReadMany(network_and_devices):
+    bacnet = network_and_devices.bacnet
+    test_device = network_and_devices.test_device
+    addr = test_device.properties.address
+    args_list = [
+        "{} {} {} presentValue".format(
+            addr,
+            test_device[name].properties.type,
+            test_device[name].properties.address,
+        )
+        for name in ("AI", "AO", "BI", "CS_VALUE")
+    ]
+    # an object the device doesn't have
+    args_list.insert(2, "{} analogInput 9999 presentValue".format(addr))
+
+    values = bacnet.readMany(args_list)
+    assert len(values) == len(args_list)
+    assert values[2] is None
+    for args, value in zip(args_list, values):
+        if "9999" not in args:
+            assert value == bacnet.read(args)
+
+
+class FakeIOCB:
+    def __init__(self, ioResponse=None, ioError=None):
+        self.ioResponse = ioResponse
+        self.ioError = ioError
+
+    def wait(self):
+        pass
+
+
+def make_array_reader(values, max_indexes=None):
+    """
+    ReadProperty whose requests are answered from values (index 0 being
+    the length) without a network. Requests for more than max_indexes
+    elements are refused like a device that doesn't support segmentation.
+    """
+    reader = ReadProperty()
+    reader.requests = []
+    array = [len(values)] + list(values)
+
+    def _read_array_indexes(args, indexes):
+        reader.requests.append(list(indexes))
+        if max_indexes is not None and len(indexes) > max_indexes:
+            return None
+        return [array[idx] for idx in indexes]
+
+    def read(args, arr_index=None, **kwargs):
+        reader.requests.append(arr_index)
+        return array[arr_index]
+
+    reader._read_array_indexes = _read_array_indexes
+    reader.read = read
+    return reader
+
+
+def test_SplitReadChunks():
+    values = ["elem{}".format(i) for i in range(1, 13)]
+    reader = make_array_reader(values, max_indexes=6)
+    assert reader._split_the_read_request(SPLIT_ARGS, None) == values
+    # 21, 11 and 6 elements asked first, then the rest by chunks of 5
+    assert [len(r) for r in reader.requests] == [21, 11, 6, 5, 2]
+    assert reader.requests[3] == [6, 7, 8, 9, 10]
+
+
+def test_SplitReadHalvesRefusedChunks():
+    values = ["elem{}".format(i) for i in range(1, 51)]
+    reader = make_array_reader(values)
+    _read_array_indexes = reader._read_array_indexes
+    refused = []
+
+    def refuse_once(args, indexes):
+        # the first chunk after the length is refused once
+        if indexes[0] == 21 and not refused:
+            refused.append(list(indexes))
+            return None
+        return _read_array_indexes(args, indexes)
+
+    reader._read_array_indexes = refuse_once
+    assert reader._split_the_read_request(SPLIT_ARGS, None) == values
+    assert refused == [list(range(21, 41))]
+    assert reader.requests[1:] == [
+        list(range(21, 31)),
+        list(range(31, 41)),
+        list(range(41, 51)),
+    ]
+
+
+def test_SplitReadWithoutReadPropertyMultiple():
+    values = ["elem{}".format(i) for i in range(1, 4)]
+    reader = make_array_reader(values)
+
+    def unrecognized(args, indexes):
+        raise UnrecognizedService()
+
+    reader._read_array_indexes = unrecognized
+    assert reader._split_the_read_request(SPLIT_ARGS, None) == values
+    assert reader.requests == [0, 1, 2, 3]
+
+
+def test_ReadArrayIndexesRefused():
+    reader = ReadProperty()
+    reader._submit_request = lambda request: FakeIOCB(ioError=AbortPDU(reason=4))
+    assert reader._read_array_indexes(SPLIT_ARGS, [0, 1, 2]) is None
+    assert reader.segmentation_supported is False
+
+
+def test_ReadArrayIndexesIdentifiers():
+    # identifiers accepted by read() are accepted by the split read
+    for args, object_id, prop_id in (
+        ("2:5 8 5 objectList", (8, 5), "objectList"),
+        ("2:5 device 5 76", ("device", 5), 76),
+        ("2:5 @obj_8 5 @prop_76", (8, 5), 76),
+    ):
+        reader = ReadProperty()
+        requests = []
+
+        def submit(request):
+            requests.append(request)
+            return FakeIOCB(ioError=AbortPDU(reason=4))
+
+        reader._submit_request = submit
+        assert reader._read_array_indexes(args, [0, 1]) is None
+        (spec,) = requests[0].listOfReadAccessSpecs
+        assert spec.objectIdentifier == object_id
+        assert [ref.propertyIdentifier for ref in spec.listOfPropertyReferences] == [
+            prop_id,
+            prop_id,
+        ]
+        assert [ref.propertyArrayIndex for ref in spec.listOfPropertyReferences] == [
+            0,
+            1,
+        ]
+
+
+def test_SplitReadErrorReadsChunkOneByOne():
+    values = ["elem{}".format(i) for i in range(1, 31)]
+    reader = make_array_reader(values)
+    del reader._read_array_indexes
+    reader._submit_request = lambda request: FakeIOCB(
+        ioError=Error(errorClass="property", errorCode="invalidArrayIndex")
+    )
+    # the device answers the chunk with an error
+    assert reader._read_array_elements(SPLIT_ARGS, list(range(21, 31)), 20) == (
+        values[20:]
+    )
+    assert reader.requests == list(range(21, 31))
+
+
+def test_SplitReadNoResponse():
+    reader = ReadProperty()
+    requests = []
+
+    def no_response(request):
+        requests.append(request)
+        return FakeIOCB(ioError=TimeoutError)
+
+    reader._submit_request = no_response
+    with pytest.raises(NoResponseFromController):
+        reader._split_the_read_request(SPLIT_ARGS, None)
+    # a device that doesn't answer is not asked again with smaller chunks
+    assert len(requests) == 1
+
+
+def test_SplitReadErrorOnFirstRequest():
+    values = ["elem1", "elem2", "elem3"]
+    array = [len(values)] + values
+    reader = ReadProperty()
+    requests = []
+
+    def submit(request):
+        (spec,) = request.listOfReadAccessSpecs
+        indexes = [ref.propertyArrayIndex for ref in spec.listOfPropertyReferences]
+        requests.append(indexes)
+        if max(indexes) >= len(array):
+            # the whole request is answered with an error
+            return FakeIOCB(
+                ioError=Error(errorClass="property", errorCode="invalidArrayIndex")
+            )
+        return FakeIOCB(ioResponse=[array[idx] for idx in indexes])
+
+    reader._submit_request = submit
+    reader._process_read_multiple_response = lambda iocb, args: iocb.ioResponse
+    assert reader._split_the_read_request(SPLIT_ARGS, None) == values
+    assert [len(indexes) for indexes in requests] == [21, 11, 6, 3, 1]
+
+
+def test_ReadManyOneRequestPerDevice():
+    reader = ReadProperty()
+    in_flight = []
+    most_in_flight = []
+
+    class PendingIOCB(FakeIOCB):
+        def wait(self):
+            in_flight.remove(self.ioResponse)
+
+    def submit(args, **kwargs):
+        in_flight.append(args)
+        addresses = [a.split()[0] for a in in_flight]
+        # never two requests pending with the same device
+        assert len(addresses) == len(set(addresses))
+        most_in_flight.append(len(in_flight))
+        return PendingIOCB(ioResponse=args)
+
+    def process(iocb, args, **kwargs):
+        if "9999" in args:
+            raise NoResponseFromController()
+        return args
+
+    reader._submit_read = submit
+    reader._process_read_response = process
+    args_list = [
+        "2:{} analogInput {} presentValue".format(device, inst)
+        for inst in (1, 2, 9999, 3)
+        for device in (5, 6, 7)
+    ]
+    values = reader.readMany(args_list, chunk_size=2)
+    assert values == [None if "9999" in a else a for a in args_list]
+    assert max(most_in_flight) == 2
+
+
+def test_ParseRPMArgsWithoutProperty():
+    with pytest.raises(ValueError, match="provide at least one property"):
+        parse_rpm_args("analogInput 1 bogus".split())
+    with pytest.raises(ValueError, match="provide at least one property"):
+        parse_rpm_args("analogInput 1 bogus analogInput 2 presentValue".split())
+
+
+def test_ReadAsyncAbortAfterLoopClosed(monkeypatch):
+    deferred_calls = []
+    monkeypatch.setattr(
+        Read, "deferred", lambda fn, *args: deferred_calls.append((fn, args))
+    )
+    reader = ReadProperty()
+    reader._submit_read = lambda *args, **kwargs: IOCB()
+
+    with pytest.raises(NoResponseFromController):
+        asyncio.run(reader.read_async(AI_ARGS, timeout=0.05))
+
+    # the abort runs in the bacpypes thread once asyncio.run() has returned
+    ((fn, args),) = deferred_calls
+    fn(*args)
+    assert fn.__self__.ioState == ABORTED
+
+
+def make_async_reader(monkeypatch, delay=0.02):
+    """
+    ReadProperty whose requests are answered by a device after delay, from
+    another thread like the bacpypes core. Each answer is the request args.
+    """
+    monkeypatch.setattr(Read, "deferred", lambda fn, *args: fn(*args))
+    reader = ReadProperty()
+    reader.sent = []
+    reader.pending = {}
+    reader.most_pending = {}
+    reader._process_read_response = lambda iocb, args, **kwargs: iocb.ioResponse
+
+    def complete(iocb, addr):
+        reader.pending[addr] -= 1
+        iocb.complete(iocb.args)
+
+    def submit(args, **kwargs):
+        addr = args.split()[0]
+        reader.sent.append(args)
+        reader.pending[addr] = reader.pending.get(addr, 0) + 1
+        reader.most_pending[addr] = max(
+            reader.most_pending.get(addr, 0), reader.pending[addr]
+        )
+        iocb = IOCB()
+        iocb.args = args
+        threading.Timer(delay, complete, args=(iocb, addr)).start()
+        return iocb
+
+    reader._submit_read = submit
+    return reader
+
+
+def test_ReadAsyncGather(monkeypatch):
+    reader = make_async_reader(monkeypatch)
+    args_list = [
+        "2:{} analogInput {} presentValue".format(device, inst)
+        for inst in range(1, 11)
+        for device in (5, 6)
+    ]
+
+    async def read_all():
+        return await asyncio.gather(
+            *[reader.read_async(args, timeout=0.1) for args in args_list]
+        )
+
+    # each read answers in 20ms, all of them take longer than the timeout
+    assert asyncio.run(read_all()) == args_list
+    # one request at a time per device, the devices read concurrently
+    assert reader.most_pending == {"2:5": 1, "2:6": 1}
+
+
+def test_ReadAsyncTimeout(monkeypatch):
+    reader = make_async_reader(monkeypatch)
+    iocbs = []
+
+    def no_answer(args, **kwargs):
+        iocbs.append(IOCB())
+        return iocbs[-1]
+
+    submit = reader._submit_read
+    reader._submit_read = no_answer
+
+    async def read_twice():
+        with pytest.raises(NoResponseFromController):
+            await reader.read_async(AI_ARGS, timeout=0.05)
+        # the device is free for the next read
+        reader._submit_read = submit
+        return await reader.read_async(AI_ARGS, timeout=0.1)
+
+    assert asyncio.run(read_twice()) == AI_ARGS
+    assert iocbs[0].ioState == ABORTED
+
+
+def test_ReadAsyncCancel(monkeypatch):
+    reader = make_async_reader(monkeypatch)
+    iocbs = []
+
+    def no_answer(args, **kwargs):
+        iocbs.append(IOCB())
+        return iocbs[-1]
+
+    reader._submit_read = no_answer
+
+    async def cancel_read():
+        task = asyncio.ensure_future(reader.read_async(AI_ARGS))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_read())
+    assert iocbs[0].ioState == ABORTED
+
+
+def test_ReadMultipleAsync(monkeypatch):
+    reader = make_async_reader(monkeypatch)
+    reader._submit_read_multiple = lambda args, **kwargs: reader._submit_read(args)
+    reader._process_read_multiple_response = lambda iocb, args, **kwargs: [
+        iocb.ioResponse
+    ]
+    args_list = [
+        "2:5 analogInput {} presentValue units".format(inst) for inst in range(1, 6)
+    ]
+
+    async def read_all():
+        return await asyncio.gather(
+            *[reader.readMultiple_async(args, timeout=0.1) for args in args_list]
+        )
+
+    assert asyncio.run(read_all()) == [[args] for args in args_list]
+    assert reader.most_pending == {"2:5": 1}
+
+
+def test_ReadAsyncSplitInExecutor(monkeypatch):
+    reader = make_async_reader(monkeypatch)
+    del reader._process_read_response
+    threads = []
+
+    def refused(args, **kwargs):
+        iocb = IOCB()
+        iocb.abort(AbortPDU(reason=4))
+        return iocb
+
+    def split(args, arr_index):
+        threads.append(threading.current_thread())
+        return ["elem1", "elem2"]
+
+    reader._submit_read = refused
+    reader._split_the_read_request = split
+    assert asyncio.run(reader.read_async(SPLIT_ARGS)) == ["elem1", "elem2"]
+    # the blocking split read didn't run in the event loop thread
+    assert threads and threads[0] is not threading.current_thread()